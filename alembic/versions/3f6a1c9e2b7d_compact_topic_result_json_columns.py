@@ -0,0 +1,151 @@
+"""compact_topic_result_json_columns
+
+Revision ID: 3f6a1c9e2b7d
+Revises: 9bf32219cd35
+Create Date: 2026-10-19 10:12:31.402118
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+from sqlalchemy.dialects import mysql
+
+# Importing the app's codec into a historical migration is only safe because
+# the FORMAT_DEFLATE_V1 dictionary is frozen (see app/models/types.py): later
+# codec changes must add a new format marker, never alter V1.
+from app.models.types import decode_compact_json, encode_compact_json
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f6a1c9e2b7d'
+down_revision: Union[str, None] = '9bf32219cd35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSON_COLUMNS = ('location_data', 'demographic_data')
+BATCH_SIZE = 1000
+
+
+def _reencode_rows(encode, commit_per_batch: bool = False) -> None:
+    """
+    Rewrite every JSON column value with `encode`, in primary-key batches.
+
+    Each batch is written with a single executemany UPDATE. With
+    `commit_per_batch` (MySQL, inside an autocommit block) every batch is its
+    own transaction, so a large table is not rewritten in one transaction and
+    an interrupted run can simply be restarted - decoding accepts both formats.
+    """
+    bind = op.get_bind()
+    topic_results = sa.table(
+        'topic_results',
+        sa.column('id', sa.Integer()),
+        *(sa.column(name, sa.LargeBinary()) for name in JSON_COLUMNS),
+    )
+    update = (
+        topic_results.update()
+        .where(topic_results.c.id == sa.bindparam('row_id'))
+        .values({name: sa.bindparam(name) for name in JSON_COLUMNS})
+    )
+
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(topic_results)
+            .where(topic_results.c.id > last_id)
+            .order_by(topic_results.c.id)
+            .limit(BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            break
+
+        params = []
+        for row in rows:
+            stored = {name: getattr(row, name) for name in JSON_COLUMNS}
+            if all(value is None for value in stored.values()):
+                continue
+            params.append({
+                'row_id': row.id,
+                **{
+                    name: None if value is None else encode(decode_compact_json(value))
+                    for name, value in stored.items()
+                },
+            })
+
+        if params:
+            if commit_per_batch:
+                bind.exec_driver_sql('START TRANSACTION')
+            bind.execute(update, params)
+            if commit_per_batch:
+                bind.exec_driver_sql('COMMIT')
+        last_id = rows[-1].id
+
+
+def _plain_json(value) -> bytes:
+    return json.dumps(value, ensure_ascii=False).encode('utf-8')
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    # The ALTER keeps each value's JSON text as bytes; the decoder understands
+    # both that and the compact format, so re-encoding can happen afterwards.
+    for name in JSON_COLUMNS:
+        if dialect == 'postgresql':
+            op.alter_column('topic_results', name,
+                            existing_type=sa.JSON(),
+                            type_=sa.LargeBinary(),
+                            postgresql_using=f"convert_to({name}::text, 'UTF8')")
+        else:
+            op.alter_column('topic_results', name,
+                            existing_type=sa.JSON(),
+                            type_=sa.LargeBinary(length=2 ** 24 - 1),
+                            existing_nullable=True)
+
+    if context.is_offline_mode():
+        # No rows to read when generating SQL (--sql). Existing values stay
+        # JSON text, which the decoder reads; rows written later are compact.
+        return
+
+    if dialect == 'mysql':
+        # MySQL DDL is not transactional anyway; commit the rewrite per batch
+        with op.get_context().autocommit_block():
+            _reencode_rows(encode_compact_json, commit_per_batch=True)
+    else:
+        _reencode_rows(encode_compact_json)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    # Write plain JSON text back so the column can be cast to JSON again
+    if context.is_offline_mode():
+        raise RuntimeError(
+            "Downgrading 3f6a1c9e2b7d decodes every topic_results row and cannot "
+            "be generated as SQL (--sql); run it against the database instead"
+        )
+    if dialect == 'mysql':
+        with op.get_context().autocommit_block():
+            _reencode_rows(_plain_json, commit_per_batch=True)
+    else:
+        _reencode_rows(_plain_json)
+
+    for name in JSON_COLUMNS:
+        if dialect == 'postgresql':
+            op.alter_column('topic_results', name,
+                            existing_type=sa.LargeBinary(),
+                            type_=sa.JSON(),
+                            postgresql_using=f"convert_from({name}, 'UTF8')::json")
+        else:
+            # MySQL refuses to build JSON from a binary-charset column
+            # (error 3144), so go through utf8mb4 text first
+            op.alter_column('topic_results', name,
+                            existing_type=sa.LargeBinary(length=2 ** 24 - 1),
+                            type_=mysql.LONGTEXT(charset='utf8mb4'),
+                            existing_nullable=True)
+            op.alter_column('topic_results', name,
+                            existing_type=mysql.LONGTEXT(charset='utf8mb4'),
+                            type_=sa.JSON(),
+                            existing_nullable=True)
@@ -0,0 +1,33 @@
+"""add_explore_topic_result_count
+
+Revision ID: 7c2d4e8a1f35
+Revises: 3f6a1c9e2b7d
+Create Date: 2026-10-19 14:37:05.881245
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2d4e8a1f35'
+down_revision: Union[str, None] = '3f6a1c9e2b7d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('explore_topics',
+                  sa.Column('result_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill from the existing results
+    op.execute(
+        "UPDATE explore_topics SET result_count = ("
+        "SELECT COUNT(*) FROM topic_results WHERE topic_results.explore_id = explore_topics.id)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('explore_topics', 'result_count')
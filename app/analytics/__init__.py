@@ -0,0 +1,15 @@
+# Offline analytics package: columnar snapshots of the topic tables and
+# in-process aggregate queries over them. Requires the optional pyarrow dependency.
+
+
+def require_pyarrow():
+    """Import pyarrow, with a clear error when the optional dependency is missing."""
+    try:
+        import pyarrow
+        import pyarrow.compute  # noqa: F401
+        import pyarrow.ipc  # noqa: F401
+    except ImportError as e:
+        raise RuntimeError(
+            "Offline analytics requires pyarrow: pip install -r requirements-analytics.txt"
+        ) from e
+    return pyarrow
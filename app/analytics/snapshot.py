@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Export explore_topics/topic_results to an offline columnar snapshot.
+
+A snapshot is a directory of uncompressed Arrow IPC files that can be
+memory-mapped by `app.analytics.trends.TrendSnapshot`:
+
+    topics.arrow        one row per ExploreTopic
+    results.arrow       one row per TopicResult (scalar columns)
+    locations.arrow     one row per item of TopicResult.location_data
+    demographics.arrow  one row per item of TopicResult.demographic_data
+
+Usage:
+    python -m app.analytics.snapshot snapshots/2026-10-19
+    python -m app.analytics.snapshot snapshots/latest --database-url mysql+pymysql://reader@replica/tiktok_trends
+"""
+
+import argparse
+import os
+import re
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.analytics import require_pyarrow
+from app.database.db_setup import SessionLocal
+from app.models.explore_topic import ExploreTopic
+from app.models.topic_result import TopicResult
+
+BATCH_SIZE = 10000
+
+# Read both tables from one consistent snapshot, so topics.result_count agrees
+# with results.arrow even while imports are running. SQLite transactions are
+# already serializable.
+SNAPSHOT_EXECUTION_OPTIONS = {
+    "postgresql": {"isolation_level": "REPEATABLE READ", "postgresql_readonly": True},
+    "mysql": {"isolation_level": "REPEATABLE READ"},
+}
+
+# Keys the scraper uses for an array item's label and its share
+LABEL_KEYS = ("name", "label", "location", "country", "region", "age", "age_group", "gender")
+VALUE_KEYS = ("value", "percent", "percentage", "share")
+
+
+def _schemas(pa):
+    topics = pa.schema([
+        ("explore_id", pa.int32()),
+        ("topic", pa.string()),
+        ("origin_user_id", pa.int32()),
+        ("last_scrape", pa.timestamp("us")),
+        ("result_count", pa.int32()),
+        ("created_at", pa.timestamp("us")),
+        ("updated_at", pa.timestamp("us")),
+    ])
+    results = pa.schema([
+        ("result_id", pa.int32()),
+        ("explore_id", pa.int32()),
+        ("keyword", pa.string()),
+        ("search_popularity", pa.float64()),
+        ("search_increase", pa.float64()),
+        ("created_at", pa.timestamp("us")),
+    ])
+    breakdown = pa.schema([
+        ("result_id", pa.int32()),
+        ("explore_id", pa.int32()),
+        ("keyword", pa.string()),
+        ("label", pa.string()),
+        ("share", pa.float64()),
+    ])
+    return topics, results, breakdown
+
+
+def _parse_share(value) -> Optional[float]:
+    """'12%' / '12' / 12 -> 12.0; anything else -> None."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = re.search(r"-?[0-9]+(?:\.[0-9]+)?", str(value).replace(",", ""))
+    return float(match.group()) if match else None
+
+
+def _flatten_item(item):
+    """(label, share) for one array item, or None if its shape is unknown."""
+    if isinstance(item, str):
+        return item, None
+    if isinstance(item, dict):
+        label = next((item[key] for key in LABEL_KEYS if item.get(key) is not None), None)
+        share = next((item[key] for key in VALUE_KEYS if item.get(key) is not None), None)
+        if label is not None:
+            return str(label), _parse_share(share)
+    return None
+
+
+def flatten_items(value):
+    """
+    Flatten a location/demographic value into (label, share) pairs.
+
+    Handles arrays of {name, value}-style objects or strings, as sent by the
+    scraper, and single objects such as {"country": "US", "region": "California"},
+    which yield one label per known label key. Returns (pairs, skipped), where
+    `skipped` counts items whose shape was not recognised.
+    """
+    if value is None:
+        return [], 0
+
+    if isinstance(value, dict):
+        if any(value.get(key) is not None for key in VALUE_KEYS):
+            value = [value]  # a single {name, value} item
+        else:
+            pairs = [(str(value[key]), None) for key in LABEL_KEYS if value.get(key) is not None]
+            return pairs, 0 if pairs else 1
+
+    if not isinstance(value, list):
+        return [], 1
+
+    pairs, skipped = [], 0
+    for item in value:
+        pair = _flatten_item(item)
+        if pair is None:
+            skipped += 1
+        else:
+            pairs.append(pair)
+    return pairs, skipped
+
+
+class _BatchWriter:
+    """Buffers rows column-wise and writes them as record batches."""
+
+    def __init__(self, pa, path: Path, schema):
+        self.pa = pa
+        self.schema = schema
+        self.columns = {name: [] for name in schema.names}
+        self.rows = 0
+        self.writer = pa.ipc.new_file(str(path), schema)
+
+    def append(self, **row):
+        for name, values in self.columns.items():
+            values.append(row[name])
+        if len(self.columns[self.schema.names[0]]) >= BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        count = len(self.columns[self.schema.names[0]])
+        if count:
+            self.writer.write_batch(self.pa.record_batch(
+                [self.pa.array(values, type=field.type)
+                 for values, field in zip(self.columns.values(), self.schema)],
+                schema=self.schema,
+            ))
+            self.rows += count
+            for values in self.columns.values():
+                values.clear()
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+
+
+def export_snapshot(output_dir, session_factory: sessionmaker = SessionLocal):
+    """
+    Write a snapshot of the topic tables to `output_dir`.
+
+    Rows are streamed from the database in batches, so memory use does not
+    grow with table size. Files are written to a temporary sibling directory
+    that replaces `output_dir` only once every file is complete, so a failed
+    export never leaves a mix of old and new files behind.
+
+    Returns the number of rows written per file, plus the number of
+    location/demographic items that were skipped because their shape was not
+    recognised.
+    """
+    pa = require_pyarrow()
+    output_dir = Path(output_dir)
+    output_dir.parent.mkdir(parents=True, exist_ok=True)
+    staging_dir = Path(tempfile.mkdtemp(prefix=f".{output_dir.name}.", dir=output_dir.parent))
+
+    try:
+        counts = _write_snapshot(pa, staging_dir, session_factory)
+        staging_dir.chmod(0o755)  # mkdtemp creates it private to the current user
+    except BaseException:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+
+    # A non-empty directory cannot be replaced in one step: move the old
+    # snapshot aside first. Readers that already memory-mapped its files keep
+    # working, as the files are only unlinked.
+    previous_dir = None
+    if output_dir.exists():
+        previous_dir = output_dir.parent / f"{staging_dir.name}.old"
+        os.replace(output_dir, previous_dir)
+    os.replace(staging_dir, output_dir)
+    if previous_dir is not None:
+        shutil.rmtree(previous_dir, ignore_errors=True)
+
+    return counts
+
+
+def _write_snapshot(pa, snapshot_dir: Path, session_factory: sessionmaker):
+    topics_schema, results_schema, breakdown_schema = _schemas(pa)
+    skipped = {"locations": 0, "demographics": 0}
+
+    with session_factory() as db:
+        # Must run before the first query, which begins the transaction
+        db.connection(execution_options=SNAPSHOT_EXECUTION_OPTIONS.get(db.get_bind().dialect.name, {}))
+
+        topics = _BatchWriter(pa, snapshot_dir / "topics.arrow", topics_schema)
+        for topic in db.query(ExploreTopic).order_by(ExploreTopic.id).yield_per(BATCH_SIZE):
+            topics.append(
+                explore_id=topic.id,
+                topic=topic.topic,
+                origin_user_id=topic.origin_user_id,
+                last_scrape=topic.last_scrape,
+                result_count=topic.result_count,
+                created_at=topic.created_at,
+                updated_at=topic.updated_at,
+            )
+        topics.close()
+
+        results = _BatchWriter(pa, snapshot_dir / "results.arrow", results_schema)
+        locations = _BatchWriter(pa, snapshot_dir / "locations.arrow", breakdown_schema)
+        demographics = _BatchWriter(pa, snapshot_dir / "demographics.arrow", breakdown_schema)
+        for result in db.query(TopicResult).order_by(TopicResult.id).yield_per(BATCH_SIZE):
+            results.append(
+                result_id=result.id,
+                explore_id=result.explore_id,
+                keyword=result.relevant_keyword,
+                search_popularity=result.search_popularity,
+                search_increase=result.search_increase,
+                created_at=result.created_at,
+            )
+            for name, writer, value in (("locations", locations, result.location_data),
+                                        ("demographics", demographics, result.demographic_data)):
+                pairs, skipped_items = flatten_items(value)
+                skipped[name] += skipped_items
+                for label, share in pairs:
+                    writer.append(
+                        result_id=result.id,
+                        explore_id=result.explore_id,
+                        keyword=result.relevant_keyword,
+                        label=label,
+                        share=share,
+                    )
+        for writer in (results, locations, demographics):
+            writer.close()
+
+    return {
+        "topics": topics.rows,
+        "results": results.rows,
+        "locations": locations.rows,
+        "demographics": demographics.rows,
+        "skipped_location_items": skipped["locations"],
+        "skipped_demographic_items": skipped["demographics"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export topic data to an Arrow snapshot")
+    parser.add_argument("output_dir", help="Directory to write the snapshot files to")
+    parser.add_argument("--database-url", help="Read from this database (e.g. a replica) instead of the configured one")
+    args = parser.parse_args()
+
+    session_factory = SessionLocal
+    if args.database_url:
+        session_factory = sessionmaker(bind=create_engine(args.database_url), class_=Session)
+
+    try:
+        counts = export_snapshot(args.output_dir, session_factory)
+    except Exception as e:
+        print(f"❌ Snapshot failed: {e}")
+        sys.exit(1)
+
+    print(f"✅ Snapshot written to {args.output_dir}")
+    for name, count in counts.items():
+        print(f"   {name}: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Aggregate trend queries over an offline snapshot.
+
+Answers analyst questions from the Arrow files written by
+`app.analytics.snapshot` using vectorized Arrow compute kernels, without
+touching the production database.
+
+    from app.analytics.trends import TrendSnapshot
+
+    snapshot = TrendSnapshot.open("snapshots/2026-10-19")
+    snapshot.top_keywords(20)
+    snapshot.popularity_distribution(explore_id=3)
+    snapshot.location_rollup(limit=10)
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+
+from app.analytics import require_pyarrow
+
+if TYPE_CHECKING:
+    import pyarrow
+
+TABLES = ("topics", "results", "locations", "demographics")
+
+
+def _columns(table, names: Dict[str, str]):
+    """Select columns by name (aggregate output order varies across pyarrow versions) and rename them."""
+    return table.select(list(names)).rename_columns(list(names.values()))
+
+
+class TrendSnapshot:
+    """Memory-mapped snapshot tables plus aggregate queries over them."""
+
+    def __init__(self, tables: Dict[str, "pyarrow.Table"]):
+        self.pa = require_pyarrow()
+        self.tables = tables
+
+    @classmethod
+    def open(cls, snapshot_dir) -> "TrendSnapshot":
+        """
+        Open a snapshot directory. The files are memory-mapped, so data is
+        paged in on demand rather than copied into the process.
+        """
+        pa = require_pyarrow()
+        snapshot_dir = Path(snapshot_dir)
+        tables = {}
+        for name in TABLES:
+            source = pa.memory_map(str(snapshot_dir / f"{name}.arrow"), "r")
+            tables[name] = pa.ipc.open_file(source).read_all()
+        return cls(tables)
+
+    def _filtered(self, name: str, explore_id: Optional[int]):
+        table = self.tables[name]
+        if explore_id is None:
+            return table
+        pc = self.pa.compute
+        return table.filter(pc.equal(table["explore_id"], explore_id))
+
+    def top_keywords(self, limit: int = 20, explore_id: Optional[int] = None,
+                     by: str = "search_popularity") -> List[Dict]:
+        """
+        Keywords ranked by their highest `by` value (search_popularity or
+        search_increase), with how many results mention them.
+        """
+        if by not in ("search_popularity", "search_increase"):
+            raise ValueError("by must be 'search_popularity' or 'search_increase'")
+
+        results = self._filtered("results", explore_id)
+        grouped = results.group_by("keyword").aggregate([
+            (by, "max"),
+            ("result_id", "count"),
+        ])
+        grouped = _columns(grouped, {"keyword": "keyword", f"{by}_max": by, "result_id_count": "result_count"})
+        # Keywords with no value for `by` sort last
+        grouped = grouped.sort_by([(by, "descending")])
+        return grouped.slice(0, limit).to_pylist()
+
+    def popularity_distribution(self, explore_id: Optional[int] = None,
+                                quantiles: Sequence[float] = (0.1, 0.25, 0.5, 0.75, 0.9, 0.99)) -> Dict:
+        """Summary statistics and quantiles of search_popularity."""
+        pc = self.pa.compute
+        values = self._filtered("results", explore_id)["search_popularity"].drop_null()
+        if len(values) == 0:
+            return {"count": 0, "min": None, "max": None, "mean": None, "stddev": None, "quantiles": {}}
+
+        min_max = pc.min_max(values).as_py()
+        return {
+            "count": len(values),
+            "min": min_max["min"],
+            "max": min_max["max"],
+            "mean": pc.mean(values).as_py(),
+            "stddev": pc.stddev(values).as_py(),
+            "quantiles": dict(zip(quantiles, pc.quantile(values, q=list(quantiles)).to_pylist())),
+        }
+
+    def _rollup(self, name: str, limit: Optional[int], explore_id: Optional[int]) -> List[Dict]:
+        breakdown = self._filtered(name, explore_id)
+        grouped = breakdown.group_by("label").aggregate([
+            ("keyword", "count_distinct"),
+            ("share", "mean"),
+            ("share", "max"),
+        ])
+        grouped = _columns(grouped, {
+            "label": "label",
+            "keyword_count_distinct": "keyword_count",
+            "share_mean": "mean_share",
+            "share_max": "max_share",
+        })
+        grouped = grouped.sort_by([("keyword_count", "descending"), ("mean_share", "descending")])
+        if limit is not None:
+            grouped = grouped.slice(0, limit)
+        return grouped.to_pylist()
+
+    def location_rollup(self, limit: Optional[int] = None, explore_id: Optional[int] = None) -> List[Dict]:
+        """Per location: number of keywords it appears for and its mean/max share."""
+        return self._rollup("locations", limit, explore_id)
+
+    def demographic_rollup(self, limit: Optional[int] = None, explore_id: Optional[int] = None) -> List[Dict]:
+        """Per demographic bucket: number of keywords it appears for and its mean/max share."""
+        return self._rollup("demographics", limit, explore_id)
+
+    def topic_summary(self) -> List[Dict]:
+        """Per topic: result count and mean/max search popularity and increase."""
+        results = self.tables["results"]
+        grouped = results.group_by("explore_id").aggregate([
+            ("result_id", "count"),
+            ("search_popularity", "mean"),
+            ("search_popularity", "max"),
+            ("search_increase", "mean"),
+        ])
+        grouped = _columns(grouped, {
+            "explore_id": "explore_id",
+            "result_id_count": "result_count",
+            "search_popularity_mean": "mean_popularity",
+            "search_popularity_max": "max_popularity",
+            "search_increase_mean": "mean_increase",
+        })
+        topics = self.tables["topics"].select(["explore_id", "topic"])
+        return grouped.join(topics, "explore_id").sort_by("explore_id").to_pylist()
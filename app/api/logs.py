@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 from datetime import datetime
 import re
 
@@ -44,6 +44,107 @@ def parse_percent(value: str):
         return None
 
 
+def collapse_whitespace(title: str) -> str:
+    """Trim and collapse runs of whitespace: ' Logo  Design ' -> 'Logo Design'."""
+    return " ".join(str(title).split())
+
+
+def normalize_keyword(title: str) -> str:
+    """Fold case and whitespace so 'Logo  Design' and 'logo design' compare equal."""
+    return collapse_whitespace(title).casefold()
+
+
+# Keys that identify a location/demographic item, e.g. {"name": "US", "value": "10%"}
+ITEM_LABEL_KEYS = ("name", "label")
+
+
+def _item_key(item):
+    """What makes two items the same entry: their label, else the item itself."""
+    if isinstance(item, dict):
+        for key in ITEM_LABEL_KEYS:
+            if item.get(key) is not None:
+                return key, item[key]
+    return None, item
+
+
+def _union(existing: list, incoming: list) -> None:
+    """
+    Merge `incoming` items into `existing` by label, keeping order. An item
+    whose label is already present replaces it, so the latest share wins;
+    strings and unlabelled items are matched by equality.
+    """
+    # Location/demographic arrays hold a handful of items, so a linear
+    # scan is cheaper than hashing every (possibly nested) item.
+    keys = [_item_key(item) for item in existing]
+    for item in incoming:
+        key = _item_key(item)
+        if key in keys:
+            existing[keys.index(key)] = item
+        else:
+            existing.append(item)
+            keys.append(key)
+
+
+def _merge_data(existing, incoming):
+    """
+    Combine two location/demographic values. Lists are merged by item label;
+    any other shape (e.g. a single dict) is kept as stored, falling back to
+    `incoming` only when nothing was stored yet.
+    """
+    if isinstance(existing, list) and isinstance(incoming, list):
+        _union(existing, incoming)
+        return existing
+    return existing if existing else incoming
+
+
+def merge_log_entries(logs: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Parse log entries and merge those sharing a normalized keyword.
+
+    For each keyword the first title spelling is kept (with its whitespace
+    collapsed), along with the highest search popularity, the trend of the
+    latest entry that has one, and the location and demographic arrays merged
+    by item label, where the latest entry's share wins. Entries without a
+    (non-blank) title are dropped.
+
+    Returns (merged rows in first-seen order, number of entries merged away).
+    """
+    rows: Dict[str, Dict[str, Any]] = {}
+    merged = 0
+    for entry in logs:
+        title = collapse_whitespace(entry.get("title") or "")
+        if not title:
+            continue
+
+        search_pop = parse_popularity(entry.get("searchPopularity"))
+        trend = parse_percent(entry.get("trendPercent"))
+        location_data = entry.get("locations") or []
+        demographic_data = entry.get("demographics") or []
+
+        key = normalize_keyword(title)
+        row = rows.get(key)
+        if row is None:
+            rows[key] = {
+                "title": title,
+                "search_popularity": search_pop,
+                "search_increase": trend,
+                # Copy lists so merging never mutates the payload; other shapes are stored verbatim
+                "location_data": list(location_data) if isinstance(location_data, list) else location_data,
+                "demographic_data": list(demographic_data) if isinstance(demographic_data, list) else demographic_data,
+            }
+            continue
+
+        merged += 1
+        if search_pop is not None and (row["search_popularity"] is None or search_pop > row["search_popularity"]):
+            row["search_popularity"] = search_pop
+        if trend is not None:
+            row["search_increase"] = trend
+        row["location_data"] = _merge_data(row["location_data"], location_data)
+        row["demographic_data"] = _merge_data(row["demographic_data"], demographic_data)
+
+    return list(rows.values()), merged
+
+
 @router.post("/")
 def import_logs(log_data: Dict[str, Any], db: Session = Depends(get_db)):
     """
@@ -66,31 +167,30 @@ def import_logs(log_data: Dict[str, Any], db: Session = Depends(get_db)):
             db.commit()
             db.refresh(explore)
 
-        imported = 0
-        for entry in logs:
-            title = entry.get("title")
-            if not title:
-                continue
-
-            # Build TopicResult row
-            search_pop = parse_popularity(entry.get("searchPopularity"))
-            trend = parse_percent(entry.get("trendPercent"))
-            location_data = entry.get("locations") or []
-            demographic_data = entry.get("demographics") or []
+        # Write each keyword once, even if the scraper logged it several times
+        rows, merged = merge_log_entries(logs)
 
+        imported = 0
+        for row in rows:
             tr = TopicResult(
                 explore_id=explore.id,
-                relevant_keyword=title,
-                search_popularity=search_pop,
-                search_increase=trend,
-                location_data=location_data,
-                demographic_data=demographic_data,
+                relevant_keyword=row["title"],
+                search_popularity=row["search_popularity"],
+                search_increase=row["search_increase"],
+                location_data=row["location_data"],
+                demographic_data=row["demographic_data"],
             )
             db.add(tr)
             imported += 1
 
+        # Bump the topic's version so HTTP validators on topic reads change;
+        # result_count is updated on flush (see app/models/topic_result.py)
+        now = datetime.utcnow()
+        explore.last_scrape = now
+        explore.touch(now)
+
         db.commit()
-        return {"imported": imported, "explore_id": explore.id, "keyword": keyword}
+        return {"imported": imported, "merged": merged, "explore_id": explore.id, "keyword": keyword}
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to import logs: {e}")
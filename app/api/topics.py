@@ -0,0 +1,161 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.api.http_cache import cache_headers, make_etag, not_modified
+from app.config import settings
+from app.database.db_setup import get_db
+from app.models.explore_topic import ExploreTopic
+from app.models.topic_result import TopicResult
+
+router = APIRouter(prefix="/topics", tags=["topics"])
+
+
+def topic_to_dict(topic: ExploreTopic):
+    return {
+        "id": topic.id,
+        "topic": topic.topic,
+        "origin_user_id": topic.origin_user_id,
+        "last_scrape": topic.last_scrape,
+        "result_count": topic.result_count,
+        "created_at": topic.created_at,
+        "updated_at": topic.updated_at,
+    }
+
+
+def result_to_dict(result: TopicResult):
+    return {
+        "id": result.id,
+        "explore_id": result.explore_id,
+        "relevant_keyword": result.relevant_keyword,
+        "search_popularity": result.search_popularity,
+        "search_increase": result.search_increase,
+        "location_data": result.location_data,
+        "demographic_data": result.demographic_data,
+        "time_period_7_days": result.time_period_7_days,
+        "time_period_today": result.time_period_today,
+        "created_at": result.created_at,
+        "updated_at": result.updated_at,
+    }
+
+
+def get_topic_or_404(explore_id: int, db: Session) -> ExploreTopic:
+    topic = db.get(ExploreTopic, explore_id)
+    if not topic:
+        raise HTTPException(status_code=404, detail="Topic not found")
+    return topic
+
+
+def topic_etag(topic: ExploreTopic) -> str:
+    """
+    Version of everything served for a topic.
+
+    result_count follows every TopicResult insert and delete, and `import_logs`
+    moves updated_at forward on each import, so this changes whenever the
+    topic's data does.
+    """
+    return make_etag(topic.id, topic.updated_at.isoformat(), topic.result_count)
+
+
+@router.get("/")
+def list_topics(request: Request, response: Response, db: Session = Depends(get_db)):
+    """
+    Get all topics with their keyword counts for dashboard display.
+    """
+    topic_count, last_modified, result_total = db.query(
+        func.count(ExploreTopic.id),
+        func.max(ExploreTopic.updated_at),
+        func.sum(ExploreTopic.result_count),
+    ).one()
+    etag = make_etag("topics", topic_count, last_modified.isoformat() if last_modified else None, result_total)
+
+    cached = not_modified(request, etag, last_modified)
+    if cached:
+        return cached
+
+    response.headers.update(cache_headers(etag, last_modified))
+    topics = db.query(ExploreTopic).order_by(ExploreTopic.id).all()
+    return [
+        {"topic": topic_to_dict(topic), "keyword_count": topic.result_count}
+        for topic in topics
+    ]
+
+
+@router.get("/{explore_id}")
+def get_topic(explore_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
+    """
+    Get a topic with all its keywords for frontend display.
+    """
+    topic = get_topic_or_404(explore_id, db)
+    etag = topic_etag(topic)
+
+    cached = not_modified(request, etag, topic.updated_at)
+    if cached:
+        return cached
+
+    response.headers.update(cache_headers(etag, topic.updated_at))
+    keywords = db.query(TopicResult.relevant_keyword).filter(
+        TopicResult.explore_id == explore_id
+    ).distinct().all()
+
+    return {
+        "topic": topic_to_dict(topic),
+        "keywords": [keyword[0] for keyword in keywords],
+    }
+
+
+@router.get("/{explore_id}/results")
+def get_topic_results(
+    explore_id: int,
+    request: Request,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    """
+    Get a page of full result records for a topic.
+    """
+    topic = get_topic_or_404(explore_id, db)
+    etag = topic_etag(topic)
+
+    cached = not_modified(request, etag, topic.updated_at)
+    if cached:
+        return cached
+
+    response.headers.update(cache_headers(etag, topic.updated_at))
+    results = db.query(TopicResult).filter(
+        TopicResult.explore_id == explore_id
+    ).order_by(TopicResult.id).offset(skip).limit(limit).all()
+
+    return {
+        "total": topic.result_count,
+        "skip": skip,
+        "limit": limit,
+        "results": [result_to_dict(result) for result in results],
+    }
+
+
+@router.get("/{explore_id}/results/{keyword}")
+def get_topic_result_by_keyword(
+    explore_id: int, keyword: str, request: Request, response: Response, db: Session = Depends(get_db)
+):
+    """
+    Get full record details for a specific keyword.
+    """
+    topic = get_topic_or_404(explore_id, db)
+    etag = topic_etag(topic)
+
+    cached = not_modified(request, etag, topic.updated_at)
+    if cached:
+        return cached
+
+    result = db.query(TopicResult).filter(
+        TopicResult.explore_id == explore_id,
+        TopicResult.relevant_keyword == keyword,
+    ).first()
+    if not result:
+        raise HTTPException(status_code=404, detail="Keyword not found")
+
+    response.headers.update(cache_headers(etag, topic.updated_at))
+    return result_to_dict(result)
@@ -22,10 +22,25 @@ class Settings(BaseSettings):
     # Pagination
     DEFAULT_PAGE_SIZE: int = 20
     MAX_PAGE_SIZE: int = 100
+
+    # HTTP caching of topic reads (clients revalidate with ETag / Last-Modified)
+    TOPIC_CACHE_MAX_AGE: int = 5
     
     # Environment
     ENVIRONMENT: str = "development"
     DEBUG: bool = True
+
+    # Production server (see app/server.py and gunicorn.conf.py)
+    HOST: str = "0.0.0.0"
+    PORT: int = 8000
+    WEB_CONCURRENCY: int = 0  # 0 = derive worker count from CPU count
+    GRACEFUL_TIMEOUT: int = 30  # seconds to let in-flight requests (incl. ingest batches) finish on shutdown
+    WARMUP_DB_CONNECTIONS: int = 2  # pooled connections opened before serving
+    RUN_MIGRATIONS_ON_STARTUP: bool = True
+
+    # Query debugging (see app/database/query_budget.py)
+    QUERY_DEBUG: bool = False  # count queries per request and report N+1 suspects
+    QUERY_BUDGET_PER_REQUEST: int = 0  # warn above this many queries; 0 = no limit
     
     model_config = {
         "env_file": ".env",
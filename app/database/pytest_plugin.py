@@ -0,0 +1,18 @@
+"""
+Pytest plugin exposing query counting to tests.
+
+Enable it in conftest.py with:
+
+    pytest_plugins = ["app.database.pytest_plugin"]
+"""
+
+import pytest
+
+from app.database.query_budget import query_budget
+
+
+@pytest.fixture
+def query_counter():
+    """Record the statements issued during a test."""
+    with query_budget() as log:
+        yield log
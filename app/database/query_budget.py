@@ -0,0 +1,220 @@
+"""
+Query counting for development and tests.
+
+Counts the SQL statements issued inside a request, test or code block, flags
+N+1 suspects (the same statement shape executed repeatedly with different
+parameters) and enforces query budgets.
+
+    # In a route (enforced only with QUERY_DEBUG or under pytest)
+    @router.get("/topics")
+    @query_budget(5)
+    def list_topics(db: Session = Depends(get_db)): ...
+
+    # Around any block
+    with query_budget(3) as log:
+        ...
+    print(log.count, log.n_plus_one_suspects())
+
+    # In tests (conftest.py): pytest_plugins = ["app.database.pytest_plugin"]
+    def test_dashboard(query_counter):
+        ...
+        assert query_counter.count <= 2
+
+`QueryCountMiddleware` reports the per-request count in an `X-Query-Count`
+header and prints N+1 suspects; it is enabled with the QUERY_DEBUG setting.
+"""
+
+import contextvars
+import functools
+import inspect
+import re
+import sys
+import threading
+from collections import Counter
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+# Statements executed at least this many times in one log are N+1 suspects
+DEFAULT_N_PLUS_ONE_THRESHOLD = 3
+
+_active_logs: contextvars.ContextVar[Tuple["QueryLog", ...]] = contextvars.ContextVar(
+    "active_query_logs", default=()
+)
+_install_lock = threading.Lock()
+_installed = False
+
+
+class QueryBudgetExceeded(Exception):
+    """Raised when a block issues more statements than its budget allows."""
+
+    def __init__(self, budget: int, log: "QueryLog"):
+        self.budget = budget
+        self.log = log
+        super().__init__(
+            f"Query budget exceeded: {log.count} statements issued, budget is {budget}"
+            + log.format_suspects()
+        )
+
+
+class QueryLog:
+    """Statements recorded while the log is active."""
+
+    def __init__(self, n_plus_one_threshold: int = DEFAULT_N_PLUS_ONE_THRESHOLD):
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.statements: List[Tuple[str, object]] = []
+        self._token: Optional[contextvars.Token] = None
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def record(self, statement: str, parameters) -> None:
+        self.statements.append((statement, parameters))
+
+    def n_plus_one_suspects(self) -> List[Tuple[str, int]]:
+        """
+        Statement shapes executed at least `n_plus_one_threshold` times with
+        differing parameters, most frequent first.
+        """
+        shapes = Counter()
+        distinct_params = {}
+        for statement, parameters in self.statements:
+            shape = _normalize(statement)
+            shapes[shape] += 1
+            distinct_params.setdefault(shape, set()).add(repr(parameters))
+
+        return [
+            (shape, count)
+            for shape, count in shapes.most_common()
+            if count >= self.n_plus_one_threshold and len(distinct_params[shape]) > 1
+        ]
+
+    def format_suspects(self) -> str:
+        suspects = self.n_plus_one_suspects()
+        if not suspects:
+            return ""
+        lines = [f"\n  {count}x {shape}" for shape, count in suspects]
+        return "\nPossible N+1 queries:" + "".join(lines)
+
+
+def _normalize(statement: str) -> str:
+    """Collapse whitespace and inlined IN-lists so equivalent statements compare equal."""
+    statement = re.sub(r"\s+", " ", statement).strip()
+    return re.sub(r"IN \((?:[^()]*)\)", "IN (...)", statement, flags=re.IGNORECASE)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    for log in _active_logs.get():
+        log.record(statement, parameters)
+
+
+def install():
+    """Start listening to statements on all engines. Safe to call repeatedly."""
+    global _installed
+    with _install_lock:
+        if not _installed:
+            event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+            _installed = True
+
+
+def _debugging() -> bool:
+    """Whether decorated functions should enforce their budgets."""
+    return settings.QUERY_DEBUG or "pytest" in sys.modules
+
+
+class query_budget:
+    """
+    Record statements issued in a block and raise `QueryBudgetExceeded`
+    when more than `max_queries` were issued. `max_queries=None` only records.
+
+    Usable as a context manager or as a decorator on sync and async
+    functions (including FastAPI route handlers). The decorator is a no-op
+    unless QUERY_DEBUG is set or pytest is running, so budgets never fail
+    production requests.
+
+    A single instance may be entered by several tasks at once: each entry
+    keeps its own log in the current context.
+    """
+
+    def __init__(self, max_queries: Optional[int] = None,
+                 n_plus_one_threshold: int = DEFAULT_N_PLUS_ONE_THRESHOLD):
+        self.max_queries = max_queries
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    def __enter__(self) -> QueryLog:
+        install()
+        log = QueryLog(self.n_plus_one_threshold)
+        log._token = _active_logs.set(_active_logs.get() + (log,))
+        return log
+
+    def __exit__(self, exc_type, exc, tb):
+        # Logs nest, so the innermost log in this context is the one we entered
+        log = _active_logs.get()[-1]
+        _active_logs.reset(log._token)
+        if exc_type is None and self.max_queries is not None and log.count > self.max_queries:
+            raise QueryBudgetExceeded(self.max_queries, log)
+        return False
+
+    def __call__(self, func):
+        if not _debugging():
+            return func
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with self:
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self:
+                return func(*args, **kwargs)
+        return wrapper
+
+
+class QueryCountMiddleware:
+    """
+    ASGI middleware that counts statements per HTTP request.
+
+    Adds an `X-Query-Count` response header and prints a warning for N+1
+    suspects or when the request exceeds `max_queries` (0 = no limit).
+    """
+
+    def __init__(self, app, max_queries: int = 0,
+                 n_plus_one_threshold: int = DEFAULT_N_PLUS_ONE_THRESHOLD):
+        self.app = app
+        self.max_queries = max_queries
+        self.n_plus_one_threshold = n_plus_one_threshold
+        install()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        log = QueryLog(self.n_plus_one_threshold)
+        token = _active_logs.set(_active_logs.get() + (log,))
+
+        async def send_with_count(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-query-count", str(log.count).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_count)
+        finally:
+            _active_logs.reset(token)
+            request = f"{scope['method']} {scope['path']}"
+            if self.max_queries and log.count > self.max_queries:
+                print(f"Warning: {request} issued {log.count} queries (budget {self.max_queries})")
+            suspects = log.format_suspects()
+            if suspects:
+                print(f"Warning: {request}{suspects}")
+
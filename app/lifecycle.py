@@ -0,0 +1,43 @@
+"""
+Worker lifecycle helpers: warm-up before serving traffic and the shutdown
+time budget.
+"""
+
+from sqlalchemy import text
+from sqlalchemy.orm import configure_mappers
+
+from app.config import settings
+from app.database.db_setup import engine
+
+
+# Shutdown budget: uvicorn waits up to GRACEFUL_TIMEOUT for in-flight requests
+# (ingest batches included) and then cancels them. Cancelling does not stop a
+# sync endpoint's threadpool work but does close its request-scoped session,
+# so there is no safe second drain phase - the whole budget goes to the wait.
+# Whatever supervises the worker must allow GRACEFUL_TIMEOUT plus
+# SHUTDOWN_MARGIN (lifespan shutdown, process exit) before killing it.
+SHUTDOWN_MARGIN = 5
+
+
+def warm_up():
+    """
+    Prepare a worker before it accepts traffic.
+
+    Configures the ORM mappers (normally done lazily on the first query) and
+    opens `WARMUP_DB_CONNECTIONS` pooled connections so the first requests do
+    not pay for the connection handshake.
+    """
+    configure_mappers()
+
+    connections = []
+    try:
+        for _ in range(max(settings.WARMUP_DB_CONNECTIONS, 0)):
+            connection = engine.connect()
+            connection.execute(text("SELECT 1"))
+            connections.append(connection)
+    except Exception as e:
+        print(f"Warning: Database warm-up failed: {e}")
+    finally:
+        # Closing returns the connections to the pool, ready for reuse
+        for connection in connections:
+            connection.close()
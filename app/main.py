@@ -2,8 +2,10 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
 from app.database.db_setup import create_tables
+from app.lifecycle import warm_up
 # Import logs router
 from app.api import logs as logs_router
+from app.api import topics as topics_router
 
 # Create FastAPI application
 app = FastAPI(
@@ -20,14 +22,26 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Last-Modified"],
 )
 
+# Per-request query counting / N+1 detection for development
+if settings.QUERY_DEBUG:
+    from app.database.query_budget import QueryCountMiddleware
+
+    app.add_middleware(
+        QueryCountMiddleware,
+        max_queries=settings.QUERY_BUDGET_PER_REQUEST,
+    )
+
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database tables on startup"""
-    create_tables()
-    print(f"Database tables created successfully. Using {settings.DATABASE_TYPE} database.")
+    """Initialize database tables and warm up the worker on startup"""
+    if settings.RUN_MIGRATIONS_ON_STARTUP:
+        create_tables()
+        print(f"Database tables created successfully. Using {settings.DATABASE_TYPE} database.")
+    warm_up()
 
 
 @app.get("/")
@@ -46,15 +60,17 @@ async def health_check():
     return {"status": "healthy", "database": settings.DATABASE_TYPE}
 
 
-# Include logs router
+# Include API routers
 app.include_router(logs_router.router, prefix="/api/v1")
+app.include_router(topics_router.router, prefix="/api/v1")
 
 
 if __name__ == "__main__":
+    # Development server; use `python -m app.server` for production
     import uvicorn
     uvicorn.run(
         "app.main:app",
-        host="0.0.0.0",
-        port=8000,
+        host=settings.HOST,
+        port=settings.PORT,
         reload=settings.DEBUG
     )
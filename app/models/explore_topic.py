@@ -1,6 +1,7 @@
 from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
 from sqlalchemy.orm import relationship
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Optional
 from app.database.db_setup import Base
 
 
@@ -15,11 +16,23 @@ class ExploreTopic(Base):
     topic = Column(String(255), nullable=False, index=True)
     origin_user_id = Column(Integer, nullable=False, index=True)
     last_scrape = Column(DateTime, nullable=True)
+    result_count = Column(Integer, default=0, server_default="0", nullable=False)  # Kept in step with topic_results on flush, see topic_result.py
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
     # Relationship to TopicResult
     topic_results = relationship("TopicResult", back_populates="explore_topic", cascade="all, delete-orphan")
 
+    def touch(self, now: Optional[datetime] = None) -> None:
+        """
+        Mark the topic's results as changed. updated_at moves forward by at
+        least one whole second, so the Last-Modified header (one-second
+        resolution) changes even for writes within the same second.
+        """
+        now = now or datetime.utcnow()
+        if self.updated_at is not None:
+            now = max(now, self.updated_at.replace(microsecond=0) + timedelta(seconds=1))
+        self.updated_at = now
+
     def __repr__(self):
         return f"<ExploreTopic(id={self.id}, topic='{self.topic}', origin_user_id={self.origin_user_id})>"
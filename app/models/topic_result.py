@@ -1,8 +1,10 @@
 from sqlalchemy import Column, Integer, String, Float, DateTime, Date, ForeignKey, Text
-from sqlalchemy.dialects.mysql import JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import event, update
+from sqlalchemy.orm import Session, relationship
+from collections import Counter
 from datetime import datetime
 from app.database.db_setup import Base
+from app.models.types import CompactJSON
 
 
 class TopicResult(Base):
@@ -17,8 +19,8 @@ class TopicResult(Base):
     relevant_keyword = Column(String(255), nullable=False, index=True)
     search_popularity = Column(Float, nullable=True)
     search_increase = Column(Float, nullable=True)
-    location_data = Column(JSON, nullable=True)  # JSON field for location information
-    demographic_data = Column(JSON, nullable=True)  # JSON field for demographic information
+    location_data = Column(CompactJSON, nullable=True)  # Compressed JSON for location information
+    demographic_data = Column(CompactJSON, nullable=True)  # Compressed JSON for demographic information
     time_period_7_days = Column(Date, nullable=True)
     time_period_today = Column(Date, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -29,3 +31,31 @@ class TopicResult(Base):
 
     def __repr__(self):
         return f"<TopicResult(id={self.id}, explore_id={self.explore_id}, keyword='{self.relevant_keyword}')>"
+
+
+@event.listens_for(Session, "after_flush")
+def _update_result_counts(session, flush_context):
+    """
+    Keep ExploreTopic.result_count in step with the TopicResult rows inserted
+    or deleted by any writer, with one UPDATE per affected topic. The counter
+    is changed in SQL, so concurrent writers cannot lose increments.
+    """
+    deltas = Counter()
+    # session.new/deleted still list what this flush wrote
+    for obj in session.new:
+        if isinstance(obj, TopicResult):
+            deltas[obj.explore_id] += 1
+    for obj in session.deleted:
+        if isinstance(obj, TopicResult):
+            deltas[obj.explore_id] -= 1
+
+    topics = Base.metadata.tables["explore_topics"]
+    for explore_id, delta in deltas.items():
+        if delta:
+            session.connection().execute(
+                update(topics)
+                .where(topics.c.id == explore_id)
+                # Assign updated_at to itself so its onupdate default does not
+                # fire; moving it is left to ExploreTopic.touch()
+                .values(result_count=topics.c.result_count + delta, updated_at=topics.c.updated_at)
+            )
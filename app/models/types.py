@@ -0,0 +1,105 @@
+"""
+Custom column types shared by the models.
+"""
+
+import json
+import zlib
+
+from sqlalchemy.types import LargeBinary, TypeDecorator
+
+
+# Format markers written as the first byte of every stored value. Neither can
+# start a valid JSON document, so legacy rows holding plain JSON text are still
+# recognised (and decoded) after the column type changes.
+FORMAT_RAW = 0x00
+FORMAT_DEFLATE_V1 = 0x01
+
+# Labels the scraper repeats on almost every row: countries/regions from
+# `locations` and age/gender buckets from `demographics`. They are fed to
+# deflate as a preset dictionary, so a label that appears in the dictionary
+# costs a couple of bytes instead of its full spelling.
+#
+# The dictionary for a format version must NEVER change once rows have been
+# written with it - add a new FORMAT_* marker and dictionary instead.
+KNOWN_LABELS_V1 = [
+    # demographic buckets
+    "18-24", "25-34", "35-44", "45-54", "55+", "13-17",
+    "male", "female", "Male", "Female", "age", "gender",
+    # regions
+    "United States", "United Kingdom", "Canada", "Australia", "Germany",
+    "France", "Italy", "Spain", "Netherlands", "Brazil", "Mexico",
+    "Argentina", "Colombia", "Japan", "South Korea", "Indonesia",
+    "Philippines", "Thailand", "Vietnam", "Malaysia", "Singapore",
+    "India", "Pakistan", "Turkey", "Saudi Arabia",
+    "United Arab Emirates", "Egypt", "Nigeria", "South Africa",
+    "Poland", "Sweden", "Russia", "Ukraine",
+    # keys used by the scraper objects
+    "name", "value", "label", "percent", "percentage", "country",
+    "region", "location",
+]
+
+# Most frequent material goes last: deflate references closer bytes cheaper.
+_ZDICT_V1 = (
+    "".join(f'"{label}"' for label in reversed(KNOWN_LABELS_V1))
+    + '[{"name":"","value":""},{"label":"","percent":""}]'
+).encode("utf-8")
+
+_DICTIONARIES = {FORMAT_DEFLATE_V1: _ZDICT_V1}
+
+
+def encode_compact_json(value) -> bytes:
+    """Serialise a JSON-compatible value into the compact storage format."""
+    raw = json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    # Raw deflate (no zlib header/checksum) primed with the label dictionary
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -15, zdict=_ZDICT_V1)
+    packed = compressor.compress(raw) + compressor.flush()
+
+    # Tiny payloads (e.g. "[]") do not benefit from compression
+    if len(packed) < len(raw):
+        return bytes([FORMAT_DEFLATE_V1]) + packed
+    return bytes([FORMAT_RAW]) + raw
+
+
+def decode_compact_json(data):
+    """Inverse of `encode_compact_json`; also accepts legacy plain JSON text."""
+    if data is None:
+        return None
+    if isinstance(data, str):
+        return json.loads(data)
+
+    data = bytes(data)
+    if not data:
+        return None
+
+    marker = data[0]
+    if marker == FORMAT_RAW:
+        return json.loads(data[1:].decode("utf-8"))
+    if marker in _DICTIONARIES:
+        decompressor = zlib.decompressobj(-15, zdict=_DICTIONARIES[marker])
+        raw = decompressor.decompress(data[1:]) + decompressor.flush()
+        return json.loads(raw.decode("utf-8"))
+
+    # Rows written before the column was converted hold plain JSON text
+    return json.loads(data.decode("utf-8"))
+
+
+class CompactJSON(TypeDecorator):
+    """
+    JSON column stored as dictionary-compressed binary.
+
+    Values are read and written as regular Python lists/dicts; the encoding
+    only affects what ends up on disk. Stored values cannot be queried with
+    database JSON functions.
+    """
+
+    impl = LargeBinary(length=2 ** 24 - 1)  # MEDIUMBLOB on MySQL
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return encode_compact_json(value)
+
+    def process_result_value(self, value, dialect):
+        return decode_compact_json(value)
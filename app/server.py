@@ -0,0 +1,98 @@
+"""
+Production entry point.
+
+Runs the API under gunicorn with uvicorn workers when gunicorn is installed
+(Linux/macOS), otherwise falls back to uvicorn's own multi-process mode.
+Worker settings live in gunicorn.conf.py at the project root.
+
+Usage: python -m app.server
+
+Importing this module switches DEBUG off for the whole process tree and
+tells workers not to run migrations (the parent runs them once), so it must
+be imported before app.config - `python -m app.server` and gunicorn.conf.py
+both do that.
+"""
+
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+# Environment variables take precedence over .env, and are inherited by
+# forked (gunicorn) and spawned (uvicorn fallback) workers alike.
+os.environ["DEBUG"] = "false"
+os.environ["RUN_MIGRATIONS_ON_STARTUP"] = "false"
+
+from app.config import settings
+
+if settings.DEBUG:
+    raise RuntimeError(
+        "app.config was imported before app.server, so DEBUG is still enabled; "
+        "start production runs with `python -m app.server`"
+    )
+
+try:
+    from uvicorn.workers import UvicornWorker
+except ImportError:  # gunicorn not installed
+    UvicornWorker = None
+
+
+def _available(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+# Prefer the C implementations shipped with uvicorn[standard]
+LOOP = "uvloop" if _available("uvloop") else "asyncio"
+HTTP = "httptools" if _available("httptools") else "h11"
+
+
+def worker_count() -> int:
+    """Number of worker processes: WEB_CONCURRENCY if set, else one per CPU."""
+    if settings.WEB_CONCURRENCY > 0:
+        return settings.WEB_CONCURRENCY
+    return os.cpu_count() or 1
+
+
+if UvicornWorker is not None:
+    class ProductionUvicornWorker(UvicornWorker):
+        """Uvicorn worker pinned to uvloop/httptools when they are available."""
+
+        CONFIG_KWARGS = {
+            **UvicornWorker.CONFIG_KWARGS,
+            "loop": LOOP,
+            "http": HTTP,
+            "timeout_graceful_shutdown": settings.GRACEFUL_TIMEOUT,
+        }
+
+
+def run():
+    """Start the production server."""
+    project_root = Path(__file__).resolve().parent.parent
+
+    if _available("gunicorn"):
+        from gunicorn.app.wsgiapp import run as gunicorn_run
+
+        sys.argv = ["gunicorn", "-c", str(project_root / "gunicorn.conf.py"), "app.main:app"]
+        gunicorn_run()
+        return
+
+    # Fallback: no preload, but still one process per core and no reloader.
+    # Migrate once here; the spawned workers skip it via the environment.
+    import uvicorn
+    from app.database.db_setup import create_tables
+
+    create_tables()
+    uvicorn.run(
+        "app.main:app",
+        host=settings.HOST,
+        port=settings.PORT,
+        workers=worker_count(),
+        loop=LOOP,
+        http=HTTP,
+        reload=False,
+        timeout_graceful_shutdown=settings.GRACEFUL_TIMEOUT,
+    )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the CompactJSON column type.
+
+Reports the bytes per row saved on `location_data`/`demographic_data` and the
+extra time spent decoding a row on read, against compact plain JSON. Payloads
+shaped like the scraper's `locations`/`demographics` arrays use labels from the
+codec's preset dictionary; the other shapes use labels and keys it does not
+contain.
+
+Usage: python benchmarks/bench_compact_json.py [--rows N]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.types import decode_compact_json, encode_compact_json
+
+# Labels covered by the preset dictionary in app/models/types.py
+REGIONS = [
+    "United States", "United Kingdom", "Canada", "Australia", "Germany",
+    "France", "Brazil", "Mexico", "Indonesia", "Philippines", "Japan",
+    "India", "Turkey", "Saudi Arabia", "Nigeria", "South Africa", "Poland",
+]
+AGE_BUCKETS = ["18-24", "25-34", "35-44", "45-54", "55+"]
+
+# Labels and shapes the dictionary was NOT built from, so the reported
+# savings are not only measuring the dictionary against its own contents
+STATES = [
+    "California", "Texas", "Florida", "New York", "Ontario", "Bavaria",
+    "Sao Paulo", "Jawa Barat", "Maharashtra", "Kanto", "Istanbul", "Lagos",
+]
+COUNTRY_CODES = ["US", "GB", "CA", "DE", "BR", "ID", "IN", "JP", "TR", "NG"]
+
+
+def scraper_row(rng: random.Random):
+    """(locations, demographics) in the {"name", "value"} shape of the scraper."""
+    locations = [
+        {"name": region, "value": f"{rng.randint(1, 100)}%"}
+        for region in rng.sample(REGIONS, rng.randint(3, 10))
+    ]
+    demographics = [
+        {"name": bucket, "value": f"{rng.randint(1, 100)}%"}
+        for bucket in AGE_BUCKETS
+    ]
+    return locations, demographics
+
+
+def sub_region_row(rng: random.Random):
+    """Off-dictionary labels and keys: sub-national regions with numeric shares."""
+    locations = [
+        {"area": state, "share": round(rng.random(), 3)}
+        for state in rng.sample(STATES, rng.randint(3, 8))
+    ]
+    demographics = [
+        {"bucket": f"{low}-{low + 4}", "share": round(rng.random(), 3)}
+        for low in range(15, 60, 5)
+    ]
+    return locations, demographics
+
+
+def single_object_row(rng: random.Random):
+    """Dict-shaped values as written by test_setup.py."""
+    locations = {"country": rng.choice(COUNTRY_CODES), "region": rng.choice(STATES)}
+    demographics = {"age_group": rng.choice(AGE_BUCKETS), "gender": rng.choice(["male", "female", "mixed"])}
+    return locations, demographics
+
+
+SHAPES = {
+    "scraper (dictionary labels)": scraper_row,
+    "sub-regions (off-dictionary)": sub_region_row,
+    "single objects (test_setup)": single_object_row,
+}
+
+
+def measure(name, rows):
+    values = [value for row in rows for value in row]
+
+    # Baseline: the most compact plain JSON text, not json.dumps' default
+    # ", "/": " separators, so savings come from the codec alone
+    plain = [json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8") for value in values]
+    compact = [encode_compact_json(value) for value in values]
+
+    plain_bytes = sum(len(v) for v in plain)
+    compact_bytes = sum(len(v) for v in compact)
+
+    start = time.perf_counter()
+    for v in plain:
+        json.loads(v)
+    plain_read = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for v in compact:
+        decode_compact_json(v)
+    compact_read = time.perf_counter() - start
+
+    n = len(rows)
+    print(f"{name}")
+    print(f"  Plain JSON bytes/row: {plain_bytes / n:.1f}")
+    print(f"  Compact bytes/row:    {compact_bytes / n:.1f}")
+    print(f"  Saved bytes/row:      {(plain_bytes - compact_bytes) / n:.1f} "
+          f"({100 * (1 - compact_bytes / plain_bytes):.1f}%)")
+    print(f"  Read overhead/row:    {1e6 * (compact_read - plain_read) / n:.2f} us "
+          f"({1e6 * plain_read / n:.2f} -> {1e6 * compact_read / n:.2f})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CompactJSON size/read benchmark")
+    parser.add_argument("--rows", type=int, default=20000, help="Number of rows to simulate per shape")
+    args = parser.parse_args()
+
+    print(f"Rows per shape: {args.rows}")
+    for name, make_row in SHAPES.items():
+        rng = random.Random(42)
+        measure(name, [make_row(rng) for _ in range(args.rows)])
+
+
+if __name__ == "__main__":
+    main()
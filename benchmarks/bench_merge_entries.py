@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark for merging duplicate entries in a `POST /logs` payload.
+
+Builds payloads shaped like scraper logs, where the same title shows up on
+several `relatedTopics` pages, and compares the rows and write time of
+inserting every entry against inserting the merged entries. Writes go to an
+in-memory SQLite database, so absolute times are lower than on MySQL; the
+row reduction is what carries over.
+
+Usage: python benchmarks/bench_merge_entries.py [--payloads N] [--keywords N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.api.logs import merge_log_entries, parse_percent, parse_popularity
+from app.database.db_setup import Base
+from app.models.explore_topic import ExploreTopic
+from app.models.topic_result import TopicResult
+
+REGIONS = ["United States", "United Kingdom", "Canada", "Brazil", "Indonesia", "India", "Japan"]
+AGE_BUCKETS = ["18-24", "25-34", "35-44", "45-54", "55+"]
+
+
+def make_payload(rng: random.Random, keywords: int):
+    """A payload of `keywords` distinct titles, each logged 1-4 times."""
+    log = []
+    for i in range(keywords):
+        title = f"keyword {i}"
+        for _ in range(rng.choice([1, 1, 2, 2, 3, 4])):
+            log.append({
+                # Different pages capitalise/space titles differently
+                "title": rng.choice([title, title.title(), f" {title}  "]),
+                "searchPopularity": f"{rng.randint(1, 999)}K",
+                "trendPercent": f"{rng.randint(-50, 300)}%",
+                "locations": [
+                    {"name": region, "value": f"{rng.randint(1, 100)}%"}
+                    for region in rng.sample(REGIONS, 3)
+                ],
+                "demographics": [
+                    {"name": bucket, "value": f"{rng.randint(1, 100)}%"}
+                    for bucket in AGE_BUCKETS
+                ],
+                "relatedTopics": [],
+            })
+    rng.shuffle(log)
+    return log
+
+
+def unmerged_rows(log):
+    """Rows exactly as import_logs wrote them before merging."""
+    return [
+        {
+            "title": entry["title"],
+            "search_popularity": parse_popularity(entry.get("searchPopularity")),
+            "search_increase": parse_percent(entry.get("trendPercent")),
+            "location_data": entry.get("locations") or [],
+            "demographic_data": entry.get("demographics") or [],
+        }
+        for entry in log if entry.get("title")
+    ]
+
+
+def write_rows(engine, rows):
+    """Insert rows the way import_logs does and return the elapsed time."""
+    start = time.perf_counter()
+    with Session(engine) as db:
+        explore = ExploreTopic(topic="bench", origin_user_id=0)
+        db.add(explore)
+        db.commit()
+        for row in rows:
+            db.add(TopicResult(
+                explore_id=explore.id,
+                relevant_keyword=row["title"],
+                search_popularity=row["search_popularity"],
+                search_increase=row["search_increase"],
+                location_data=row["location_data"],
+                demographic_data=row["demographic_data"],
+            ))
+        db.commit()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Payload merge benchmark")
+    parser.add_argument("--payloads", type=int, default=50, help="Number of payloads to import")
+    parser.add_argument("--keywords", type=int, default=200, help="Distinct keywords per payload")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    payloads = [make_payload(rng, args.keywords) for _ in range(args.payloads)]
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+
+    entries = sum(len(log) for log in payloads)
+    plain_rows = plain_prepare = plain_write = 0
+    merged_rows = merged_total = merged_prepare = merged_write = 0
+
+    for log in payloads:
+        start = time.perf_counter()
+        rows = unmerged_rows(log)
+        plain_prepare += time.perf_counter() - start
+        plain_rows += len(rows)
+        plain_write += write_rows(engine, rows)
+
+        start = time.perf_counter()
+        rows, merged = merge_log_entries(log)
+        merged_prepare += time.perf_counter() - start
+        merged_rows += len(rows)
+        merged_total += merged
+        merged_write += write_rows(engine, rows)
+
+    print(f"Payloads:               {args.payloads}")
+    print(f"Log entries:            {entries}")
+    print(f"Rows written (plain):   {plain_rows}")
+    print(f"Rows written (merged):  {merged_rows} ({merged_total} entries merged, "
+          f"{100 * (1 - merged_rows / plain_rows):.1f}% fewer rows)")
+    print(f"Parse+write (plain):    {plain_prepare * 1000:.1f} + {plain_write * 1000:.1f} ms")
+    print(f"Parse+merge+write:      {merged_prepare * 1000:.1f} + {merged_write * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
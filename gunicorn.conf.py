@@ -0,0 +1,42 @@
+"""
+Gunicorn configuration for production runs.
+
+Usage: gunicorn -c gunicorn.conf.py app.main:app   (or: python -m app.server)
+"""
+
+# app.server must come first: it disables DEBUG and per-worker migrations
+# (migrations run once in the master, see on_starting) before settings load
+from app.server import worker_count
+from app.config import settings
+from app.lifecycle import SHUTDOWN_MARGIN
+
+bind = f"{settings.HOST}:{settings.PORT}"
+workers = worker_count()
+worker_class = "app.server.ProductionUvicornWorker"
+
+# Import the app once in the master so workers share the loaded modules
+preload_app = True
+
+# On SIGTERM workers stop accepting connections and uvicorn waits up to
+# GRACEFUL_TIMEOUT for in-flight requests, ingest batches included; the margin
+# covers the rest of the worker's shutdown (see app/lifecycle.py)
+graceful_timeout = settings.GRACEFUL_TIMEOUT + SHUTDOWN_MARGIN
+timeout = 120
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
+
+
+def on_starting(server):
+    """Bring the schema up to date once, before any worker is forked."""
+    from app.database.db_setup import create_tables
+
+    create_tables()
+
+
+def post_fork(server, worker):
+    """Drop pooled connections inherited from the master; each worker opens its own."""
+    from app.database.db_setup import engine
+
+    engine.dispose(close=False)
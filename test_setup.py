@@ -77,12 +77,14 @@ def test_model_creation():
         
         db.add(result1)
         db.add(result2)
+        topic.touch()  # result_count is updated on flush; this moves Last-Modified
         db.commit()
         print(f"✅ Created TopicResults: {result1}, {result2}")
         
         # Test relationship query
         topic_with_results = db.query(ExploreTopic).filter(ExploreTopic.id == topic.id).first()
         print(f"✅ Topic has {len(topic_with_results.topic_results)} results")
+        print(f"✅ Topic result_count: {topic_with_results.result_count}")
         
         # Test keyword query
         keywords = db.query(TopicResult.relevant_keyword).filter(